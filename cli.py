@@ -12,15 +12,40 @@ python cli.py --site themuse --query "data scientist" --location "New York, NY"
 from __future__ import annotations
 
 import argparse
-import json
+import heapq
+import importlib.util
+import itertools
+import logging
+import operator
 import os
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from typing import List
 
+import msgspec
 from tabulate import tabulate
 
 from job_scraper import get_scraper, SCRAPERS
+from job_scraper.scrapers.base import JobPosting
+
+
+logger = logging.getLogger(__name__)
+
+# Placeholder scrapers that always raise NotImplementedError; skipped by ``--site all``.
+STUB_SITES = ("indeed", "linkedin")
+
+# Output formats written with the optional pyarrow dependency
+ARROW_FORMATS = (".parquet", ".feather")
+
+# Characters that would break a TSV row, mapped to spaces
+_TSV_ESCAPES = str.maketrans("\t\r\n", "   ")
+
+# Field values of a JobPosting, in the same order as JobPosting.__struct_fields__
+_job_values = operator.attrgetter(*JobPosting.__struct_fields__)
+
+# Serialises JobPosting structs straight to JSON bytes, without intermediate dicts
+_json_encoder = msgspec.json.Encoder()
 
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
@@ -28,8 +53,8 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     parser.add_argument(
         "--site",
         default="themuse",
-        choices=list(SCRAPERS.keys()),
-        help="Which job site to query (default: %(default)s)",
+        choices=list(SCRAPERS.keys()) + ["all"],
+        help="Which job site to query, or 'all' to query every implemented site concurrently (default: %(default)s)",
     )
     parser.add_argument(
         "--query",
@@ -55,13 +80,31 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         "-m",
         type=int,
         default=50,
-        help="Maximum number of results to return (default: %(default)s).",
+        help="Maximum number of results to return (default: %(default)s). Use 0 for no limit.",
     )
     parser.add_argument(
         "--output",
         "-o",
         default=None,
-        help="Optional output file.  Supports .json and .csv extensions.  If omitted, results are printed to the console.",
+        help="Optional output file.  Supports .json, .jsonl, .csv, .parquet and .feather extensions.  If omitted, results are printed to the console.",
+    )
+    parser.add_argument(
+        "--format",
+        "-f",
+        default="table",
+        choices=["table", "tsv", "json"],
+        help="Console output format when --output is not given (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=60,
+        help="Minutes to reuse cached API responses for repeated queries (default: %(default)s). Use 0 to disable caching.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch fresh results instead of using the on‑disk response cache.",
     )
     return parser.parse_args(argv)
 
@@ -82,55 +125,167 @@ def format_console(jobs) -> None:
     print(table)
 
 
+def format_tsv(jobs) -> None:
+    """Print jobs to stdout as tab‑separated values, one job per line.
+
+    Skips table formatting entirely, which is much faster for large result
+    sets and easier to pipe into other tools.  Tabs and line breaks inside a
+    field are replaced with spaces so each job stays on one line with five
+    columns.
+    """
+    sys.stdout.writelines(
+        "\t".join((
+            job.title.translate(_TSV_ESCAPES),
+            job.company.translate(_TSV_ESCAPES),
+            job.location.translate(_TSV_ESCAPES),
+            job.publication_date.strftime("%Y-%m-%d"),
+            job.url.translate(_TSV_ESCAPES),
+        )) + "\n"
+        for job in jobs
+    )
+
+
+def write_json(jobs, f) -> None:
+    """Write jobs to the binary file ``f`` as a JSON array, one job per line.
+
+    Jobs are serialised one at a time rather than building the whole list of
+    dictionaries in memory first.
+    """
+    f.write(b"[")
+    for i, job in enumerate(jobs):
+        f.write(b",\n  " if i else b"\n  ")
+        f.write(_json_encoder.encode(job))
+    f.write(b"\n]\n" if jobs else b"]\n")
+
+
 def write_output(jobs, path: str) -> None:
     """Write the list of job postings to the given output file.
 
-    The format is inferred from the file extension.  JSON (``.json``) and CSV
-    (``.csv``) are supported.
+    The format is inferred from the file extension.  JSON (``.json``),
+    newline‑delimited JSON (``.jsonl``) and CSV (``.csv``) are supported, as
+    are Parquet (``.parquet``) and Feather (``.feather``) if pyarrow is
+    installed.
     """
     ext = os.path.splitext(path)[1].lower()
     if ext == ".json":
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump([job.to_dict() for job in jobs], f, ensure_ascii=False, indent=2)
+        with open(path, "wb") as f:
+            write_json(jobs, f)
+        print(f"Wrote {len(jobs)} jobs to {path}")
+    elif ext == ".jsonl":
+        with open(path, "wb") as f:
+            for job in jobs:
+                f.write(_json_encoder.encode(job))
+                f.write(b"\n")
         print(f"Wrote {len(jobs)} jobs to {path}")
     elif ext == ".csv":
         import csv
 
         with open(path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["title", "company", "location", "publication_date", "description", "url"],
-            )
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(JobPosting.__struct_fields__)
             for job in jobs:
-                writer.writerow(job.to_dict())
+                writer.writerow(
+                    value.isoformat() if isinstance(value, datetime) else value
+                    for value in _job_values(job)
+                )
+        print(f"Wrote {len(jobs)} jobs to {path}")
+    elif ext in ARROW_FORMATS:
+        # pyarrow is an optional dependency, only needed for these formats
+        import pyarrow as pa
+
+        arrow_types = {str: pa.string(), datetime: pa.timestamp("us")}
+        schema = pa.schema([
+            (field.name, arrow_types[field.type]) for field in msgspec.structs.fields(JobPosting)
+        ])
+        table = pa.Table.from_pydict(
+            {name: [getattr(job, name) for job in jobs] for name in schema.names},
+            schema=schema,
+        )
+        if ext == ".parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(table, path, compression="zstd")
+        else:
+            import pyarrow.feather as feather
+
+            feather.write_feather(table, path, compression="lz4")
         print(f"Wrote {len(jobs)} jobs to {path}")
     else:
-        raise ValueError(f"Unsupported output format '{ext}'. Please use .json or .csv.")
+        raise ValueError(
+            f"Unsupported output format '{ext}'. Please use .json, .jsonl, .csv, .parquet or .feather."
+        )
+
+
+def search_all(scrapers, query: str, *, max_results: int | None = None, **kwargs) -> list:
+    """Run ``search`` on several scrapers concurrently and combine the results.
+
+    Each scraper is network‑bound, so running them in a thread pool makes the
+    total latency roughly that of the slowest site rather than the sum.  At
+    most ``max_results`` postings are taken from each scraper.
+
+    If a site fails unexpectedly the error is logged and the other sites'
+    results are still returned.  ``NotImplementedError`` from a stub scraper
+    is re‑raised.
+    """
+
+    def collect(scraper) -> list:
+        postings = scraper.search(query, max_results=max_results, **kwargs)
+        return list(itertools.islice(postings, max_results))
+
+    jobs = []
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        futures = {executor.submit(collect, s): s for s in scrapers}
+        for future in as_completed(futures):
+            try:
+                jobs.extend(future.result())
+            except NotImplementedError:
+                raise
+            except Exception as exc:
+                logger.error("Error searching %s: %s", futures[future].site_name, exc)
+    return jobs
 
 
 def main(argv: List[str] | None = None) -> None:
     args = parse_args(argv or sys.argv[1:])
+    # Check for pyarrow up front rather than failing after every site has been scraped
+    if args.output:
+        ext = os.path.splitext(args.output)[1].lower()
+        if ext in ARROW_FORMATS and importlib.util.find_spec("pyarrow") is None:
+            print(f"Writing {ext} files requires pyarrow. Install it with: pip install pyarrow", file=sys.stderr)
+            sys.exit(1)
     site = args.site.lower()
-    scraper = get_scraper(site)
+    # As with --days, a TTL of 0 disables caching
+    cache_ttl = None if args.no_cache or args.cache_ttl <= 0 else timedelta(minutes=args.cache_ttl)
+    if site == "all":
+        scrapers = [cls(cache_ttl=cache_ttl) for name, cls in SCRAPERS.items() if name not in STUB_SITES]
+    else:
+        scrapers = [get_scraper(site, cache_ttl=cache_ttl)]
     # If days is 0, treat as no filtering
     days = args.days if args.days > 0 else None
+    # Likewise a max_results of 0 means no limit
+    max_results = args.max_results if args.max_results > 0 else None
     try:
-        jobs = list(
-            scraper.search(
-                args.query,
-                location=args.location,
-                days=days,
-                max_results=args.max_results,
-            )
+        jobs = search_all(
+            scrapers,
+            args.query,
+            location=args.location,
+            days=days,
+            max_results=max_results,
         )
     except NotImplementedError as e:
         print(str(e), file=sys.stderr)
         sys.exit(1)
-    # Sort jobs by publication date descending
-    jobs.sort(key=lambda j: j.publication_date, reverse=True)
+    # Keep the newest ``max_results`` jobs, sorted by publication date descending
+    jobs = heapq.nlargest(
+        max_results or len(jobs), jobs, key=operator.attrgetter("publication_date")
+    )
     if args.output:
         write_output(jobs, args.output)
+    elif args.format == "tsv":
+        format_tsv(jobs)
+    elif args.format == "json":
+        sys.stdout.flush()
+        write_json(jobs, sys.stdout.buffer)
     else:
         format_console(jobs)
 
@@ -9,11 +9,12 @@ scraper by name.
 from .scrapers import SCRAPERS
 
 
-def get_scraper(site_name: str):
+def get_scraper(site_name: str, **kwargs):
     """Return an instance of the scraper for the given site name.
 
     Args:
         site_name: The identifier of the site (e.g. ``"themuse"``).
+        **kwargs: Passed to the scraper's constructor (e.g. ``cache_ttl``).
 
     Raises:
         KeyError: If the scraper is not registered.
@@ -21,7 +22,7 @@ def get_scraper(site_name: str):
     site = site_name.lower()
     if site not in SCRAPERS:
         raise KeyError(f"Unknown site '{site_name}'. Available sites: {', '.join(SCRAPERS.keys())}")
-    return SCRAPERS[site]()
+    return SCRAPERS[site](**kwargs)
 
 
 __all__ = ["get_scraper", "SCRAPERS"]
\ No newline at end of file
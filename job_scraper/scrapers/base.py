@@ -8,14 +8,45 @@ The ``site_name`` class attribute is used to register the scraper.
 from __future__ import annotations
 
 import abc
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, Iterable, List, Optional
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
 
+import msgspec
+from selectolax.lexbor import LexborHTMLParser
 
-@dataclass
-class JobPosting:
-    """Represents a single job posting returned by a scraper."""
+
+# Elements whose text should not run into the text that precedes or follows them
+_BLOCK_SELECTOR = "p, div, br, li, h1, h2, h3, h4, h5, h6, tr, td, th"
+
+
+def _strip_html(html: str) -> str:
+    """HTML tags stripper for job descriptions.
+
+    Parses ``html`` with selectolax's C parser, drops script/style elements
+    and returns the remaining text with whitespace condensed.
+    """
+    if not html:
+        return ""
+    tree = LexborHTMLParser(html)
+    # Remove script/style tags and their contents
+    tree.strip_tags(["script", "style"])
+    # Pad block‑level elements with spaces so adjacent paragraphs and list
+    # items don't run together; inline tags (<b>, <a>, ...) are left alone
+    # so words and punctuation around them stay intact
+    for node in tree.css(_BLOCK_SELECTOR):
+        node.insert_before(" ")
+        node.insert_after(" ")
+    # Condense whitespace
+    return " ".join(tree.text().split())
+
+
+class JobPosting(msgspec.Struct, frozen=True):
+    """Represents a single job posting returned by a scraper.
+
+    Being a :class:`msgspec.Struct`, postings are slotted and can be encoded
+    to JSON directly (e.g. ``msgspec.json.encode(jobs)``), with
+    ``publication_date`` written as an ISO 8601 string.
+    """
 
     title: str
     company: str
@@ -24,18 +55,39 @@ class JobPosting:
     description: str
     url: str
 
-    def to_dict(self) -> Dict[str, str]:
-        """Convert the job posting to a dictionary of simple types for easy
-        serialisation (e.g. JSON or CSV).
+    @classmethod
+    def from_muse(cls, job: dict, publication_date: datetime) -> JobPosting:
+        """Build a posting from a job returned by The Muse API.
+
+        ``publication_date`` is passed in already parsed, since the scraper
+        needs it for filtering before deciding to build the posting.
+        """
+        # Use the first location name if available; else empty string
+        locations = job.get("locations", [])
+        return cls(
+            title=job.get("name", "").strip(),
+            company=job.get("company", {}).get("name", "").strip(),
+            location=locations[0].get("name", "") if locations else "",
+            publication_date=publication_date,
+            description=_strip_html(job.get("contents", "")),
+            # Use the job's public URL (refs.landing_page) if available
+            url=job.get("refs", {}).get("landing_page", ""),
+        )
+
+    @classmethod
+    def from_remotive(cls, job: dict, publication_date: datetime) -> JobPosting:
+        """Build a posting from a job returned by the Remotive API.
+
+        See :meth:`from_muse` for the meaning of ``publication_date``.
         """
-        return {
-            "title": self.title,
-            "company": self.company,
-            "location": self.location,
-            "publication_date": self.publication_date.isoformat(),
-            "description": self.description,
-            "url": self.url,
-        }
+        return cls(
+            title=job.get("title", "").strip(),
+            company=job.get("company_name", "").strip(),
+            location=job.get("candidate_required_location", "").strip(),
+            publication_date=publication_date,
+            description=_strip_html(job.get("description", "")),
+            url=job.get("url", "").strip(),
+        )
 
 
 class BaseScraper(abc.ABC):
@@ -50,6 +102,23 @@ class BaseScraper(abc.ABC):
     #: Unique identifier for the job board (e.g. ``"themuse"``)
     site_name: str = ""
 
+    #: Base name of the on‑disk HTTP response cache; each site gets its own file
+    CACHE_NAME = ".jobscraper_cache"
+
+    def __init__(self, *, cache_ttl: Optional[timedelta] = None) -> None:
+        """
+        Args:
+            cache_ttl: How long to reuse HTTP responses cached on disk (in
+                ``CACHE_NAME``‑prefixed files in the working directory).  If
+                ``None`` (the default), responses are not cached.
+        """
+        self.cache_ttl = cache_ttl
+
+    @property
+    def _cache_name(self) -> str:
+        """Path (without extension) of this site's response cache."""
+        return f"{self.CACHE_NAME}_{self.site_name}"
+
     def __repr__(self) -> str:  # pragma: no cover - simple representation
         return f"<{self.__class__.__name__} site={self.site_name!r}>"
 
@@ -77,11 +146,34 @@ class BaseScraper(abc.ABC):
             An iterable of job postings.
         """
 
+    @staticmethod
+    def _cutoff(days: Optional[int]) -> Optional[datetime]:
+        """Return the oldest publication date accepted for ``days``, or None
+        if ``days`` is None.
+
+        Compute this once per search and compare each job's date against it,
+        rather than calling :meth:`_within_days` for every job.
+        """
+        if days is None:
+            return None
+        return datetime.utcnow() - timedelta(days=days)
+
+    @staticmethod
+    def _parse_date(value: str) -> datetime:
+        """Parse an ISO 8601 publication date from an API into a naive
+        datetime comparable with :meth:`_cutoff`.
+
+        A trailing ``Z`` is accepted on Pythons older than 3.11, and any
+        timezone information is dropped.
+        """
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+
     def _within_days(self, date: datetime, days: Optional[int]) -> bool:
         """Return True if ``date`` is within ``days`` of now, or if ``days``
         is None.
+
+        Kept for compatibility; per‑job loops should hoist :meth:`_cutoff`
+        and compare against it inline instead.
         """
-        if days is None:
-            return True
-        delta = datetime.utcnow() - date
-        return delta.days < days
\ No newline at end of file
+        cutoff = self._cutoff(days)
+        return cutoff is None or date >= cutoff
\ No newline at end of file
@@ -15,11 +15,14 @@ filtering based on publication date.
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import timedelta
 from typing import Iterable, Optional
 
-import dateutil.parser
+import msgspec
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base import BaseScraper, JobPosting
 
@@ -33,6 +36,29 @@ class RemotiveScraper(BaseScraper):
     site_name = "remotive"
     API_ENDPOINT = "https://remotive.com/api/remote-jobs"
 
+    def __init__(self, *, cache_ttl: Optional[timedelta] = None) -> None:
+        super().__init__(cache_ttl=cache_ttl)
+        # Reused across requests for keep‑alive and connection pooling
+        self._session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        """Create a pooled session that retries transient failures and,
+        unless disabled, caches responses on disk for ``cache_ttl``.
+        """
+        if self.cache_ttl is not None:
+            session = requests_cache.CachedSession(
+                cache_name=self._cache_name, backend="sqlite", expire_after=self.cache_ttl
+            )
+        else:
+            session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        session.mount("https://", adapter)
+        return session
+
     def search(
         self,
         query: str,
@@ -45,54 +71,39 @@ class RemotiveScraper(BaseScraper):
         if query:
             params["search"] = query
         try:
-            response = requests.get(self.API_ENDPOINT, params=params, timeout=10)
+            response = self._session.get(self.API_ENDPOINT, params=params, timeout=10)
         except Exception as exc:
             logger.error("Error contacting Remotive API: %s", exc)
-            return []
+            return
         if response.status_code != 200:
             logger.error("Remotive API returned status %s", response.status_code)
-            return []
-        data = response.json()
+            return
+        data = msgspec.json.decode(response.content)
         jobs = data.get("jobs", [])
-        results: list[JobPosting] = []
+        fetched = 0
+        cutoff = self._cutoff(days)
+        location_lc = location.lower() if location else None
         for job in jobs:
             # Publication date as ISO string
             try:
-                pub_date = dateutil.parser.isoparse(job.get("publication_date")).replace(tzinfo=None)
+                pub_date = self._parse_date(job["publication_date"])
             except Exception:
                 continue
-            if not self._within_days(pub_date, days):
+            if cutoff is not None and pub_date < cutoff:
                 continue
             # Filter by location: candidate_required_location is a string like "Worldwide" or "USA Only"
-            job_location = job.get("candidate_required_location", "").strip()
-            if location:
+            if location_lc:
                 # Accept if location substring matches (case‑insensitive)
-                if location.lower() not in job_location.lower():
+                if location_lc not in job.get("candidate_required_location", "").lower():
                     continue
-            title = job.get("title", "").strip()
-            company_name = job.get("company_name", "").strip()
-            url = job.get("url", "").strip()
-            description = self._strip_html(job.get("description", ""))
-            posting = JobPosting(
-                title=title,
-                company=company_name,
-                location=job_location,
-                publication_date=pub_date,
-                description=description,
-                url=url,
-            )
-            results.append(posting)
-            if max_results is not None and len(results) >= max_results:
-                break
-        return results
-
-    @staticmethod
-    def _strip_html(html: str) -> str:
-        """Naively remove HTML tags from Remotive job descriptions."""
-        import re
-
-        html = re.sub(r"<script.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r"<style.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<[^>]+>", "", html)
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
\ No newline at end of file
+            # Build the JobPosting object, skipping malformed jobs
+            try:
+                posting = JobPosting.from_remotive(job, pub_date)
+            except (KeyError, AttributeError, TypeError) as exc:
+                # e.g. a sub‑object such as ``company`` sent as null
+                logger.debug("Skipping malformed Remotive job %r: %s", job.get("id"), exc)
+                continue
+            yield posting
+            fetched += 1
+            if max_results is not None and fetched >= max_results:
+                break
\ No newline at end of file
@@ -10,25 +10,35 @@ The API supports parameters such as:
 * ``q`` – keywords (free‑text search)
 * ``location`` – location string (city, state, or remote)
 * ``page`` – page number (1‑indexed)
+* ``descending`` – return the newest jobs first
 
-This scraper fetches jobs page by page, applies client‑side filtering on
-publication date and location, and yields :class:`JobPosting` instances.
+This scraper fetches the first page to learn the total page count, then
+fetches the remaining pages concurrently with :mod:`aiohttp`.  Client‑side
+filtering on publication date and location is applied to each page, in page
+order, and :class:`JobPosting` instances are yielded as each page arrives.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+from collections import deque
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import AsyncIterator, Iterable, Optional
 
-import dateutil.parser
-import requests
+import aiohttp
+import aiohttp_client_cache
+import msgspec
 
 from .base import BaseScraper, JobPosting
 
 
 logger = logging.getLogger(__name__)
 
+# Location substrings that mark a job as remote‑friendly
+_REMOTE_KEYWORDS = ("remote", "flexible")
+
 
 class TheMuseScraper(BaseScraper):
     """Scraper implementation for The Muse job board."""
@@ -37,6 +47,9 @@ class TheMuseScraper(BaseScraper):
 
     API_ENDPOINT = "https://www.themuse.com/api/public/jobs"
 
+    #: Upper bound on page requests in flight so we don't hammer the API.
+    MAX_CONCURRENT_REQUESTS = 8
+
     def search(
         self,
         query: str,
@@ -45,112 +58,225 @@ class TheMuseScraper(BaseScraper):
         days: Optional[int] = None,
         max_results: Optional[int] = None,
     ) -> Iterable[JobPosting]:
-        """Search The Muse API for jobs matching the criteria.
+        """Search The Muse API for jobs matching the criteria.
+
+        See :meth:`BaseScraper.search` for argument details.  Postings are
+        yielded as each page is decoded; requests for later pages are already
+        in flight and resume each time the next page is awaited.
+        """
+        loop = asyncio.new_event_loop()
+        pages = self._search_async(query, location=location, days=days, max_results=max_results)
+        try:
+            while True:
+                try:
+                    batch = loop.run_until_complete(pages.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield from batch
+        finally:
+            # Cancels outstanding page requests if the caller stops early
+            loop.run_until_complete(pages.aclose())
+            loop.close()
+
+    async def _search_async(
+        self,
+        query: str,
+        *,
+        location: Optional[str],
+        days: Optional[int],
+        max_results: Optional[int],
+    ) -> AsyncIterator[list[JobPosting]]:
+        """Fetch the first page to learn the page count, then fetch the
+        remaining pages concurrently, yielding each page's postings.
 
-        See :meth:`BaseScraper.search` for argument details.
+        Pages are consumed in order so results match the API ordering.  Only
+        a sliding window of pages is requested ahead of the one being
+        consumed (see :meth:`_pages_ahead`), and pagination stops once
+        ``max_results`` is hit or a page is entirely older than the ``days``
+        cutoff.
         """
-        results: list[JobPosting] = []
-        page = 1
         fetched = 0
-        total_pages: Optional[int] = None
-        while True:
-            # If the API reports the total page count, stop when we've
-            # exceeded it.  The API is 1‑indexed.
-            if total_pages is not None and page > total_pages:
-                break
-            params = {"page": page}
-            # Add query and location parameters if supplied
-            if query:
-                params["q"] = query
-            if location:
-                params["location"] = location
-            # Request the API
+        # Newest first, so pagination can stop at the first stale page
+        params = {"descending": "true"}
+        # Add query and location parameters if supplied
+        if query:
+            params["q"] = query
+        if location:
+            params["location"] = location
+        cutoff = self._cutoff(days)
+        async with self._client_session() as session:
+            data = await self._fetch_page(session, {**params, "page": 1})
+            total_pages: Optional[int] = None
+            next_page = 2
+            pending: deque[asyncio.Future] = deque()
+            pages_consumed = 0
+            # Publication date range seen so far, for estimating how many pages remain
+            first_newest: Optional[datetime] = None
+            oldest: Optional[datetime] = None
             try:
-                response = requests.get(self.API_ENDPOINT, params=params, timeout=10)
-            except Exception as exc:
-                logger.error("Error contacting The Muse API: %s", exc)
-                break
-            if response.status_code != 200:
-                logger.error(
-                    "The Muse API returned non‑200 status %s for page %s", response.status_code, page
-                )
-                break
-            data = response.json()
-            jobs = data.get("results", [])
-            if not jobs:
-                break  # no more results
-            for job in jobs:
-                # Parse publication date
-                try:
-                    pub_date = dateutil.parser.isoparse(job["publication_date"]).replace(tzinfo=None)
-                except Exception:
-                    continue
-                if not self._within_days(pub_date, days):
-                    continue
-                # Filter by location if provided: at least one of the job's locations must
-                # include the search location (case‑insensitive substring match).
-                if location:
-                    loc_names = [loc.get("name", "") for loc in job.get("locations", [])]
-                    match = any(location.lower() in loc_name.lower() for loc_name in loc_names)
-                    # Also include remote/flexible jobs when searching by location
-                    remote_keywords = ["remote", "flexible"]
-                    if not match:
-                        match = any(
-                            any(keyword in loc_name.lower() for keyword in remote_keywords)
-                            for loc_name in loc_names
+                while data is not None:
+                    jobs = data.get("results", [])
+                    if not jobs:
+                        break  # no more results
+                    remaining = None if max_results is None else max_results - fetched
+                    batch, page_newest, page_oldest = self._parse_jobs(
+                        jobs, location=location, cutoff=cutoff, limit=remaining
+                    )
+                    pages_consumed += 1
+                    fetched += len(batch)
+                    if batch:
+                        yield batch
+                    if max_results is not None and fetched >= max_results:
+                        break
+                    # Once a whole page predates the cutoff, every later page does too.
+                    # A page without any parseable date says nothing either way.
+                    if cutoff is not None and page_newest is not None and page_newest < cutoff:
+                        break
+                    if first_newest is None:
+                        first_newest = page_newest
+                    if page_oldest is not None:
+                        oldest = page_oldest if oldest is None else min(oldest, page_oldest)
+                    if total_pages is None:
+                        # The API reports the total page count on every page; it is 1‑indexed.
+                        try:
+                            total_pages = int(data.get("page_count", 0))
+                        except Exception:
+                            total_pages = 0
+                    ahead = self._pages_ahead(
+                        pages_consumed=pages_consumed,
+                        fetched=fetched,
+                        max_results=max_results,
+                        cutoff=cutoff,
+                        first_newest=first_newest,
+                        oldest=oldest,
+                    )
+                    while len(pending) < ahead and next_page <= total_pages:
+                        pending.append(
+                            asyncio.ensure_future(self._fetch_page(session, {**params, "page": next_page}))
                         )
-                    if not match:
-                        continue
-                # Build the JobPosting object
-                title = job.get("name", "").strip()
-                company_name = job.get("company", {}).get("name", "").strip()
-                # Use the first location name if available; else empty string
-                loc = job.get("locations", [])
-                if loc:
-                    loc_str = loc[0].get("name", "")
-                else:
-                    loc_str = ""
-                description = self._strip_html(job.get("contents", ""))
-                # Use the job's public URL (refs.page) if available
-                url = job.get("refs", {}).get("landing_page", "")
-                posting = JobPosting(
-                    title=title,
-                    company=company_name,
-                    location=loc_str,
-                    publication_date=pub_date,
-                    description=description,
-                    url=url,
-                )
-                results.append(posting)
-                fetched += 1
-                if max_results is not None and fetched >= max_results:
-                    return results
-            # Advance to next page
-            # Update the total number of pages after the first request
-            if total_pages is None:
-                try:
-                    total_pages = int(data.get("page_count", 0))
-                except Exception:
-                    total_pages = 0
-            # Move to next page
-            page += 1
-        return results
-
-    @staticmethod
-    def _strip_html(html: str) -> str:
-        """Very naive HTML tags stripper for job descriptions.
-
-        The Muse returns HTML in the `contents` field.  This helper removes
-        tags for a cleaner plain‑text output.  For a production scraper
-        you might use BeautifulSoup instead.
+                        next_page += 1
+                    if not pending:
+                        break
+                    data = await pending.popleft()
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _pages_ahead(
+        self,
+        *,
+        pages_consumed: int,
+        fetched: int,
+        max_results: Optional[int],
+        cutoff: Optional[datetime],
+        first_newest: Optional[datetime],
+        oldest: Optional[datetime],
+    ) -> int:
+        """Return how many pages to keep requested ahead of the current one.
+
+        This is at most :attr:`MAX_CONCURRENT_REQUESTS`, reduced to the number
+        of pages the search is expected to still need: extrapolated from the
+        postings per page so far when ``max_results`` is set, and from the
+        publication dates covered per page so far when ``cutoff`` is set.
+        """
+        ahead = self.MAX_CONCURRENT_REQUESTS
+        if max_results is not None and fetched:
+            per_page = fetched / pages_consumed
+            ahead = min(ahead, math.ceil((max_results - fetched) / per_page))
+        if cutoff is not None and first_newest is not None and oldest is not None:
+            if oldest <= cutoff:
+                # The cutoff falls within the pages seen; the next one is likely stale
+                return 1
+            per_page = (first_newest - oldest) / pages_consumed
+            if per_page:
+                ahead = min(ahead, math.ceil((oldest - cutoff) / per_page))
+        return max(ahead, 1)
+
+    def _client_session(self) -> aiohttp.ClientSession:
+        """Return the session used for one search, caching responses on disk
+        for ``cache_ttl`` unless caching is disabled.
+        """
+        if self.cache_ttl is None:
+            return aiohttp.ClientSession()
+        cache = aiohttp_client_cache.SQLiteBackend(
+            cache_name=f"{self._cache_name}.sqlite", expire_after=self.cache_ttl
+        )
+        return aiohttp_client_cache.CachedSession(cache=cache)
+
+    async def _fetch_page(self, session: aiohttp.ClientSession, params: dict) -> Optional[dict]:
+        """Fetch a single page of results, returning ``None`` on failure."""
+        try:
+            async with session.get(
+                self.API_ENDPOINT, params=params, timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status != 200:
+                    logger.error(
+                        "The Muse API returned non‑200 status %s for page %s",
+                        response.status,
+                        params["page"],
+                    )
+                    return None
+                return msgspec.json.decode(await response.read())
+        except Exception as exc:
+            logger.error("Error contacting The Muse API: %s", exc)
+            return None
+
+    def _parse_jobs(
+        self,
+        jobs: list,
+        *,
+        location: Optional[str],
+        cutoff: Optional[datetime],
+        limit: Optional[int] = None,
+    ) -> tuple[list[JobPosting], Optional[datetime], Optional[datetime]]:
+        """Build :class:`JobPosting` objects for the jobs on a single page
+        that pass the date and location filters.
+
+        ``cutoff`` is the oldest accepted publication date (see
+        :meth:`BaseScraper._cutoff`), or None to disable date filtering.  At
+        most ``limit`` postings are built.
+
+        Returns:
+            The postings, followed by the newest and oldest publication dates
+            parsed on the page (``None`` if no date could be parsed).
         """
-        import re
-
-        # Remove script/style tags and their contents
-        html = re.sub(r"<script.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r"<style.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        # Remove all HTML tags
-        text = re.sub(r"<[^>]+>", "", html)
-        # Condense whitespace
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
\ No newline at end of file
+        location_lc = location.lower() if location else None
+        postings: list[JobPosting] = []
+        newest: Optional[datetime] = None
+        oldest: Optional[datetime] = None
+        for job in jobs:
+            # Parse publication date
+            try:
+                pub_date = self._parse_date(job["publication_date"])
+            except Exception:
+                continue
+            if newest is None or pub_date > newest:
+                newest = pub_date
+            if oldest is None or pub_date < oldest:
+                oldest = pub_date
+            if cutoff is not None and pub_date < cutoff:
+                continue
+            # Filter by location if provided: at least one of the job's locations must
+            # include the search location (case‑insensitive substring match).
+            if location_lc:
+                loc_names = [loc.get("name", "").lower() for loc in job.get("locations", [])]
+                match = any(location_lc in loc_name for loc_name in loc_names)
+                # Also include remote/flexible jobs when searching by location
+                if not match:
+                    match = any(
+                        any(keyword in loc_name for keyword in _REMOTE_KEYWORDS)
+                        for loc_name in loc_names
+                    )
+                if not match:
+                    continue
+            # Build the JobPosting object, skipping malformed jobs
+            try:
+                postings.append(JobPosting.from_muse(job, pub_date))
+            except (KeyError, AttributeError, TypeError) as exc:
+                # e.g. a sub‑object such as ``company`` sent as null
+                logger.debug("Skipping malformed The Muse job %r: %s", job.get("id"), exc)
+                continue
+            if limit is not None and len(postings) >= limit:
+                break
+        return postings, newest, oldest
\ No newline at end of file